@@ -1,56 +1,52 @@
 import random
 
+def evaluate(genes, values, weights):
+    """
+    Computes the total worth and weight of the items selected by a gene bitmask in a single pass.
+    :param genes: Integer bitmask where bit i indicates inclusion of item i.
+    :param values: Tuple of item values, indexed by item.
+    :param weights: Tuple of item weights, indexed by item.
+    :return: Tuple of total value and total weight of selected items.
+    """
+    fitness = 0
+    weight = 0
+    # Visit only the set bits, lowest first
+    while genes:
+        lowest = genes & -genes
+        i = lowest.bit_length() - 1
+        fitness += values[i]
+        weight += weights[i]
+        genes ^= lowest
+    return fitness, weight
+
+
 class Chromosome:
     """
     Represents a chromosome (solution) for the genetic algorithm applied to the knapsack problem.
-    Each gene in the chromosome is a binary string representing whether an item is included (1) or not (0).
+    The genes are packed into a single integer bitmask where bit i is set when item i is included.
     """
-    
-    def __init__(self, genes, knapsack):
-        """
-        Initializes a chromosome with genes and computes its fitness and weight.
-        :param genes: List of binary values (as strings) indicating inclusion of items.
-        :param knapsack: Dictionary of items with value and weight.
-        """
-        self.genes = genes
-        self.fitness = self.calculate_fitness(knapsack)
-        self.weight = self.total_weight(knapsack)
 
-    def calculate_fitness(self, knapsack):
-        """
-        Calculates the total worth of the items included in the chromosome.
-        :param knapsack: Dictionary of items with value and weight.
-        :return: Total value of selected items.
-        """
-        fitness = 0
-        # Sum values of selected items
-        for i in range(len(self.genes)):
-            if self.genes[i] == '1': # If gene is 1 it means this item is selected from knapsack so add its worth to fitness
-                fitness += knapsack[i][0]
-        return fitness
+    # Fixed attribute layout: no per-instance __dict__, faster attribute access
+    __slots__ = ('genes', 'item_strs', 'fitness', 'weight')
 
-    def total_weight(self, knapsack):
+    def __init__(self, genes, values, weights, item_strs):
         """
-        Calculates the total weight of the items included in the chromosome.
-        :param knapsack: Dictionary of items with value and weight.
-        :return: Total weight of selected items.
+        Initializes a chromosome with genes and computes its fitness and weight.
+        :param genes: Integer bitmask where bit i indicates inclusion of item i.
+        :param values: Tuple of item values, indexed by item.
+        :param weights: Tuple of item weights, indexed by item.
+        :param item_strs: Tuple of preformatted item descriptions, indexed by item.
         """
-        weight = 0
-        for i in range(len(self.genes)):
-            if self.genes[i] == '1': # If gene is 1 it means this item is selected from knapsack so add its weight to weight variable
-                weight += knapsack[i][1]
-        return weight
+        self.genes = genes
+        self.item_strs = item_strs
+        self.fitness, self.weight = evaluate(genes, values, weights)
 
     def __str__(self):
         """
         Creates a human-readable string representation of the chromosome.
         :return: A string showing items included in the knapsack.
         """
-        output = ''
-        for i in range(len(self.genes)):
-            if self.genes[i] == '1':
-                output += f'Item worth {knapsack[i][0]} and weight {knapsack[i][1]} \n'
-        return output
+        return ''.join(s for i, s in enumerate(self.item_strs) if self.genes >> i & 1)
 
 
 class GeneticAlgorithm:
@@ -59,45 +55,61 @@ class GeneticAlgorithm:
     Includes population generation, selection, crossover, mutation, and evolution logic.
     """
 
-    def __init__(self, weight_limit, knapsack, population_size, mutation_rate):
+    def __init__(self, weight_limit, values, weights, population_size, mutation_rate):
         """
         Initializes the genetic algorithm parameters.
         :param weight_limit: Maximum allowed weight of the knapsack.
-        :param knapsack: Dictionary of items with value and weight.
+        :param values: Sequence of item values, indexed by item.
+        :param weights: Sequence of item weights, indexed by item.
         :param population_size: Number of individuals in the population.
         :param mutation_rate: Probability of gene mutation (between 0 and 1).
         """
         self.weight_limit = weight_limit
-        self.knapsack = knapsack
+        # Item values and weights as flat tuples, so evaluation indexes them directly
+        self.values = tuple(values)
+        self.weights = tuple(weights)
+        if len(self.values) != len(self.weights):
+            raise ValueError(f'Got {len(self.values)} item values but {len(self.weights)} item weights')
         self.population_size = population_size
         self.mutation_rate = mutation_rate
+        self.n = len(self.values) # Number of items, i.e. genes per chromosome
+        self.cut = self.n // 2 # Single crossover point
+        self.low_mask = (1 << self.cut) - 1 # Bits of the genes before the crossover point
+        self.high_mask = ((1 << self.n) - 1) ^ self.low_mask # Bits of the genes from the crossover point on
+        # Item descriptions are formatted once and shared by every chromosome
+        self.item_strs = tuple(f'Item worth {v} and weight {w} \n' for v, w in zip(self.values, self.weights))
+        # Items from lowest to highest worth per unit of weight, the order in which overweight members drop items
+        self.repair_order = sorted(range(self.n), key=lambda i: self.values[i] / self.weights[i] if self.weights[i] else float('inf'))
         self.population = self.initialize_population()
 
     def initialize_population(self):
         """
         Creates an initial population of valid chromosomes.
+        Random members that exceed the weight limit are repaired by greedily dropping their least valuable items per unit of weight.
         :return: List of Chromosome objects within weight limit.
         """
         population = []
-        while len(population) < self.population_size:
-            member = [random.choice(['0', '1']) for _ in range(10)]
-            member = Chromosome(member, self.knapsack)
-            if member.weight <= self.weight_limit:
-                population.append(member)
+        for _ in range(self.population_size):
+            member = random.getrandbits(self.n)
+            weight = evaluate(member, self.values, self.weights)[1]
+            # Repair: remove selected items in ascending worth-to-weight order until the member fits
+            for i in self.repair_order:
+                if weight <= self.weight_limit:
+                    break
+                if member >> i & 1:
+                    member ^= 1 << i
+                    weight -= self.weights[i]
+            population.append(Chromosome(member, self.values, self.weights, self.item_strs))
         return population
 
     def selection(self):
         """
-        Selects two fittest chromosomes from the population using elitism.
-        :return: List of two selected Chromosome objects.
+        Ranks the population from fittest to least fit using elitism.
+        Consecutive chromosomes in the ranking are mated: the two fittest form the first pair, the next two the second, and so on.
+        :return: List of Chromosome objects sorted by descending fitness.
         """
-        selected = []
-        one = max(self.population, key=lambda c: c.fitness)
-        self.population.remove(one)
-        two = max(self.population, key=lambda c: c.fitness)
-        self.population.remove(two)
-        selected.extend([one, two])
-        return selected
+        # A stable sort keeps ties in population order, matching repeated max() picks
+        return sorted(self.population, key=lambda c: c.fitness, reverse=True)
 
     def crossover(self, parent1, parent2):
         """
@@ -107,11 +119,13 @@ class GeneticAlgorithm:
         :param parent2: Second parent Chromosome.
         :return: Two child Chromosomes after crossover.
         """
-        array1 = parent1.genes[0:5] + parent2.genes[5:]
-        array2 = parent2.genes[0:5] + parent1.genes[5:]
+        low = self.low_mask
+        high = self.high_mask
+        array1 = (parent1.genes & low) | (parent2.genes & high)
+        array2 = (parent2.genes & low) | (parent1.genes & high)
 
-        child1 = Chromosome(array1, self.knapsack)
-        child2 = Chromosome(array2, self.knapsack)
+        child1 = Chromosome(array1, self.values, self.weights, self.item_strs)
+        child2 = Chromosome(array2, self.values, self.weights, self.item_strs)
 
         # Replace children with parents if they exceed weight limit
         if child1.weight > self.weight_limit:
@@ -127,23 +141,21 @@ class GeneticAlgorithm:
         :param chromosome: Chromosome to mutate.
         :return: Mutated Chromosome object.
         """
-        number = int(self.mutation_rate * len(chromosome.genes)) # For calculating how many genes to mutate
-        numbers = random.sample(range(len(chromosome.genes)), number) # Random selecting genes number out of total genes
+        number = int(self.mutation_rate * self.n) # For calculating how many genes to mutate
+        numbers = random.sample(range(self.n), number) # Random selecting genes number out of total genes
 
         for i in numbers:
-            original_gene = chromosome.genes[i]
-            # Flip the bit
-            chromosome.genes[i] = '0' if original_gene == '1' else '1'
-
-            # Recalculate fitness and weight
-            chromosome.weight = chromosome.total_weight(self.knapsack)
-            chromosome.fitness = chromosome.calculate_fitness(self.knapsack)
-
-            # Revert if weight limit is exceeded
-            if chromosome.weight > self.weight_limit:
-                chromosome.genes[i] = original_gene
-                chromosome.weight = chromosome.total_weight(self.knapsack) # Recalculate weight
-                chromosome.fitness = chromosome.calculate_fitness(self.knapsack) # Recalculate fitness
+            worth = self.values[i]
+            weight = self.weights[i]
+            # Flipping a selected item removes it, flipping an unselected one adds it
+            sign = -1 if chromosome.genes >> i & 1 else 1
+            new_weight = chromosome.weight + sign * weight
+
+            # Flip the bit and update fitness and weight only if the weight limit is respected
+            if new_weight <= self.weight_limit:
+                chromosome.genes ^= 1 << i
+                chromosome.weight = new_weight
+                chromosome.fitness += sign * worth
 
         return chromosome
 
@@ -153,8 +165,8 @@ class GeneticAlgorithm:
         Replaces the old population with a new one.
         """
         new_population = []
-        for _ in range(self.population_size // 2):
-            p1, p2 = self.selection()
+        ranked = self.selection()
+        for p1, p2 in zip(ranked[0::2], ranked[1::2]):
             c1, c2 = self.crossover(p1, p2)
             c1 = self.mutation(c1)
             c2 = self.mutation(c2)
@@ -171,30 +183,38 @@ class GeneticAlgorithm:
 
 def build_knapsack(file):
     """
-    Reads item data from a file and constructs the knapsack dictionary.
+    Reads item data from a file and splits it into value and weight columns.
     :param file: File path containing item values and weights.
-    :return: Tuple containing weight limit and knapsack dictionary.
+    :return: Tuple containing weight limit, tuple of item values and tuple of item weights.
+    :raises ValueError: If a line does not hold exactly two integers or there are fewer than count item lines.
     """
-    w = None 
-    knapsack = {}
-
     with open(file, 'r') as file:
-        line = file.readline()
-        count, w = list(int(i) for i in line.split())
-        for i in range(count):
-            line = file.readline()
-            worth, weight = list(int(i) for i in line.split())
-            knapsack[i] = (worth, weight)
-    
-    return w, knapsack
+        lines = file.read().splitlines()
+
+    header = lines[0].split() if lines else []
+    if len(header) != 2:
+        raise ValueError('First line must contain the item count and the weight limit')
+    count, w = int(header[0]), int(header[1])
+    if len(lines) - 1 < count:
+        raise ValueError(f'Expected {count} item lines, found {len(lines) - 1}')
+
+    values = []
+    weights = []
+    for i in range(1, count + 1):
+        fields = lines[i].split()
+        if len(fields) != 2:
+            raise ValueError(f'Line {i + 1} must contain exactly an item worth and weight')
+        values.append(int(fields[0]))
+        weights.append(int(fields[1]))
+    return w, tuple(values), tuple(weights)
 
 
 if __name__ == "__main__":
     # Load knapsack data from file
-    w, knapsack = build_knapsack('test case for 0-1 knapsack problem.txt')
+    w, values, weights = build_knapsack('test case for 0-1 knapsack problem.txt')
 
     # Initialize Genetic Algorithm
-    ga = GeneticAlgorithm(w, knapsack, population_size=10, mutation_rate=0.2)
+    ga = GeneticAlgorithm(w, values, weights, population_size=10, mutation_rate=0.2)
     
     # Evolve the population over 50 generations
     for _ in range(50):
@@ -202,7 +222,7 @@ if __name__ == "__main__":
 
     # Display all chromosome fitness and weights
     for i in ga.population:
-        print(i.fitness, i.total_weight(knapsack), sep=' ')
+        print(i.fitness, i.weight, sep=' ')
     
     print()
 